@@ -0,0 +1,143 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import html
+from datetime import datetime
+
+# Custom CSS styling
+CUSTOM_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #1f77b4;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.2rem;
+        color: #666;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .stats-table {
+        width: 100%;
+        border-collapse: collapse;
+    }
+    .stats-table td {
+        padding: 0.4rem 0.5rem;
+        border-bottom: 1px solid rgba(128, 128, 128, 0.2);
+    }
+    .stats-table td:last-child {
+        font-size: 1.3rem;
+        font-weight: bold;
+        text-align: right;
+    }
+</style>
+"""
+
+def _freeze_frame(df):
+    # Mark the numpy buffers behind numeric/datetime columns read-only so in-place
+    # edits raise. Extension columns (category, string[pyarrow]) are skipped:
+    # to_numpy() returns a fresh copy for them, so freezing it would protect nothing.
+    for column in df.columns:
+        if not isinstance(df[column].dtype, np.dtype):
+            continue
+        values = df[column].to_numpy()
+        while isinstance(values, np.ndarray):
+            values.setflags(write=False)
+            values = values.base
+    return df
+
+# Static mock profile, built once at import
+_DEPTHS = np.array([0, 50, 100, 200, 500, 1000, 1500, 2000], dtype=np.int64)
+_TEMPERATURE = np.array([28.5, 26.2, 23.1, 18.5, 12.3, 6.8, 4.2, 2.5], dtype=np.float64)
+_SALINITY = np.array([34.5, 34.8, 35.1, 35.4, 35.2, 34.9, 34.7, 34.6], dtype=np.float64)
+for _values in (_DEPTHS, _TEMPERATURE, _SALINITY):
+    _values.setflags(write=False)
+
+# Mock data generator; shared read-only across sessions, so no per-call copy
+@st.cache_resource
+def generate_mock_argo_data():
+    floats = pd.DataFrame({
+        'float_id': ['WMO2902756', 'WMO2902757', 'WMO2902758', 'WMO2902759', 'WMO2902760'],
+        'latitude': [8.5, 10.1, 12.3, 6.8, 15.2],
+        'longitude': [76.2, 75.8, 74.5, 77.1, 73.8],
+        'last_update': pd.date_range(end=datetime.now(), periods=5, freq='D'),
+        'status': ['active', 'active', 'active', 'active', 'inactive'],
+        'profiles_count': [145, 132, 167, 89, 201]
+    })
+    # Dictionary/Arrow-backed strings keep the st.dataframe Arrow payload compact
+    floats['status'] = floats['status'].astype('category')
+    floats['float_id'] = floats['float_id'].astype('string[pyarrow]')
+    
+    profiles = pd.DataFrame({
+        'depth': _DEPTHS,
+        'temperature': _TEMPERATURE,
+        'salinity': _SALINITY,
+        'pressure': _DEPTHS * 1.02
+    })
+    
+    return _freeze_frame(floats), _freeze_frame(profiles)
+
+# Export payloads, serialized once per profile data rather than every rerun
+@st.cache_data
+def csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data
+def json_bytes(df):
+    return df.to_json(orient='records').encode('utf-8')
+
+# Per-session memo keyed on the identity of the input frame. The mock data is
+# cached with st.cache_resource, so the same object comes back on every rerun
+# and this skips the DataFrame hashing st.cache_data would do for every call.
+# The frame itself is kept alongside the value so its id() cannot be reused.
+def cached_by_id(key, builder, df):
+    cache = st.session_state.setdefault('_derived_cache', {})
+    source, value = cache.get(key, (None, None))
+    if source is not df:
+        value = builder(df)
+        cache[key] = (df, value)
+    return value
+
+# Label/value stat rows as one HTML table, sent as a single markdown element
+def stats_table_html(rows):
+    cells = "".join(
+        f"<tr><td>{html.escape(str(label))}</td><td>{html.escape(str(value))}</td></tr>"
+        for label, value in rows
+    )
+    return f'<table class="stats-table">{cells}</table>'
+
+# Keywords per response, in priority order; the first key with a hit wins
+QUERY_KEYWORDS = {
+    'temperature': ('temperature', 'temp'),
+    'salinity': ('salinity',),
+    'map': ('float', 'location', 'map'),
+    'compare': ('compare', 'ts'),
+}
+
+RESPONSES = {
+    'temperature': ("Temperature profile data available.", 'temperature'),
+    'salinity': ("Salinity profile data available.", 'salinity'),
+    'map': ("Float location data available.", 'map'),
+    'compare': ("T-S comparison data available.", 'compare'),
+}
+
+FALLBACK_RESPONSE = ("Try asking: Show temperature profiles, Find floats near coordinates, or Compare salinity data.", None)
+
+# Flattened (keyword, response) pairs in priority order, so a query costs one
+# C-level substring check per keyword and no regex or nested loop
+_KEYWORD_RESPONSES = tuple(
+    (keyword, RESPONSES[key])
+    for key, keywords in QUERY_KEYWORDS.items()
+    for keyword in keywords
+)
+
+def process_nl_query(query):
+    query_lower = query.lower()
+    for keyword, (text, viz_type) in _KEYWORD_RESPONSES:
+        if keyword in query_lower:
+            return {"text": text, 'viz_type': viz_type}
+    text, viz_type = FALLBACK_RESPONSE
+    return {"text": text, 'viz_type': viz_type}